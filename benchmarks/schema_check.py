@@ -0,0 +1,62 @@
+"""
+Times loading and checking large generated schemas.
+
+Usage: python benchmarks/schema_check.py [number of nodes]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import jtd
+
+def generate_schema(nodes):
+    # A codegen-style schema: many definitions of objects with a mix of
+    # scalar, nullable, array and map properties, plus refs between them.
+    definitions = {}
+    count = 0
+    i = 0
+    while count < nodes:
+        definitions["type{}".format(i)] = {
+            "properties": {
+                "id": { "type": "string" },
+                "createdAt": { "type": "timestamp", "nullable": True },
+                "tags": { "elements": { "type": "string" }},
+                "counts": { "values": { "type": "uint32" }},
+                "status": { "enum": ["ACTIVE", "INACTIVE"] },
+            },
+            "optionalProperties": {
+                "parent": { "ref": "type{}".format(max(0, i - 1)) },
+                "event": {
+                    "discriminator": "kind",
+                    "mapping": {
+                        "a": { "properties": { "x": { "type": "int32" }}},
+                        "b": { "optionalProperties": { "y": { "type": "float64" }}},
+                    },
+                },
+            },
+            "additionalProperties": True,
+        }
+        count += 15
+        i += 1
+
+    return { "definitions": definitions, "ref": "type0" }
+
+def main():
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    data = generate_schema(nodes)
+    schema = jtd.Schema.from_dict(data)
+
+    runs = 10
+    from_dict = timeit.timeit(lambda: jtd.Schema.from_dict(data), number=runs) / runs
+    check = timeit.timeit(lambda: schema.check(), number=runs) / runs
+
+    print("nodes:          {}".format(nodes))
+    print("from_dict:      {:.2f} ms".format(from_dict * 1000))
+    print("check:          {:.2f} ms".format(check * 1000))
+    print("problems found: {}".format(len(schema.check())))
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,6 @@
-from .schema import Schema
-from .validate import MaxDepthExceededError, ValidationError, ValidationOptions, validate
+from .schema import Schema, SchemaError
+from .validate import BudgetExceededError, MaxDepthExceededError, PointerResolutionError, SamplingResult, SkippedEntries, ValidationError, ValidationOptions, validate, validate_at, validate_sampled
+from .generate import GenerationOptions, Mutation, generate, generate_ndjson
+from .optimize import OptimizationResult, optimize, optimize_all
+from .match import match_all, match_any
+from .revalidate import revalidate
@@ -0,0 +1,273 @@
+import dataclasses
+import enum
+import json
+import random
+import string
+import strict_rfc3339
+from typing import Any, Dict, Iterator, List, Optional
+
+from .schema import Form, Schema
+
+class Mutation(enum.Enum):
+    """
+    Represents the kinds of violations :func:`generate` can inject into the
+    instances it produces, when ``mutation_rate`` in :class:`GenerationOptions`
+    is set.
+    """
+
+    WRONG_TYPE = enum.auto()
+    """A value of a JSON type the schema does not accept."""
+
+    OUT_OF_RANGE = enum.auto()
+    """A number outside the range of an integer type."""
+
+    NOT_IN_ENUM = enum.auto()
+    """A string that is not one of the values of an enum."""
+
+    BAD_TIMESTAMP = enum.auto()
+    """A string that is not a valid timestamp."""
+
+    MISSING_PROPERTY = enum.auto()
+    """An object that lacks one of its required properties."""
+
+    ADDITIONAL_PROPERTY = enum.auto()
+    """An object that has a property its schema does not allow."""
+
+    BAD_DISCRIMINATOR = enum.auto()
+    """An object whose discriminator tag is not in the mapping."""
+
+@dataclasses.dataclass
+class GenerationOptions:
+    """Represents options that can be passed to :func:`generate`."""
+
+    max_elements: int = 8
+    """
+    The maximum number of entries in generated arrays (``elements``) and
+    objects (``values``). The actual number is picked at random.
+    """
+
+    max_string_length: int = 16
+    """The maximum length of generated strings and object keys."""
+
+    max_depth: int = 8
+    """
+    The nesting depth past which generated values are kept as small as the
+    schema allows: arrays and ``values`` objects are empty, optional properties
+    are left out, and ``nullable`` values are ``None``.
+
+    Schemas that, through refs, require infinitely deep instances cannot be
+    generated from; ultimately, stack overflow will cause an error instead.
+    """
+
+    null_rate: float = 0.1
+    """The probability that a ``nullable`` value is ``None``."""
+
+    optional_rate: float = 0.5
+    """The probability that each optional property is present."""
+
+    mutation_rate: float = 0
+    """
+    The probability that each value is replaced by one that violates its
+    schema, using one of the kinds listed in ``mutations``.
+
+    A value of zero means that generated instances are always valid.
+    """
+
+    mutations: Optional[List[Mutation]] = None
+    """
+    The kinds of violations that may be injected. A value of ``None`` means that
+    all kinds of :class:`Mutation` may be used.
+    """
+
+def generate(**kwargs) -> Any:
+    """
+    Generates a random instance of a schema.
+
+    Provide the schema using the `schema` keyword argument. Optionally, you can
+    pass a `seed` to make the output reproducible, and
+    :class:`GenerationOptions` with the `options` keyword argument to tune the
+    size of the output or to inject violations.
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({
+    ...     'properties': {
+    ...         'id': { 'type': 'uint32' },
+    ...         'tags': { 'elements': { 'enum': ['a', 'b'] }},
+    ...     },
+    ... })
+    >>> instance = jtd.generate(schema=schema, seed=42)
+    >>> jtd.validate(schema=schema, instance=instance)
+    []
+    >>> instance == jtd.generate(schema=schema, seed=42)
+    True
+
+    >>> options = jtd.GenerationOptions(mutation_rate=1, mutations=[jtd.Mutation.WRONG_TYPE])
+    >>> instance = jtd.generate(schema=schema, seed=42, options=options)
+    >>> jtd.validate(schema=schema, instance=instance)
+    [ValidationError(instance_path=[], schema_path=['properties'])]
+    """
+
+    return next(_Generator(kwargs).generate_many(1))
+
+def generate_ndjson(**kwargs):
+    """
+    Writes random instances of a schema to a file as newline-delimited JSON
+    (NDJSON), one instance per line. Instances are written as soon as they are
+    generated, so memory use does not grow with the number of instances.
+
+    Provide the schema using the `schema` keyword argument, the text file to
+    write to with the `file` keyword argument, and the number of instances with
+    the `count` keyword argument. `seed` and `options` work just like in
+    :func:`generate`.
+
+    >>> import io
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({ 'enum': ['a', 'b'] })
+    >>> out = io.StringIO()
+    >>> jtd.generate_ndjson(schema=schema, file=out, count=3, seed=1)
+    >>> out.getvalue()
+    '"a"\\n"a"\\n"b"\\n'
+    """
+
+    for instance in _Generator(kwargs).generate_many(kwargs['count']):
+        kwargs['file'].write(json.dumps(instance))
+        kwargs['file'].write("\n")
+
+_INT_RANGES = {
+    "int8": (-128, 127),
+    "uint8": (0, 255),
+    "int16": (-32768, 32767),
+    "uint16": (0, 65535),
+    "int32": (-2147483648, 2147483647),
+    "uint32": (0, 4294967295),
+}
+
+# 2100-01-01T00:00:00Z
+_MAX_TIMESTAMP = 4102444800
+
+class _Generator:
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.root = kwargs['schema']
+        self.config = kwargs.get('options', GenerationOptions())
+        self.random = random.Random(kwargs.get('seed'))
+        self.mutations = set(Mutation if self.config.mutations is None else self.config.mutations)
+
+    def generate_many(self, count: int) -> Iterator[Any]:
+        for _ in range(count):
+            yield self.generate(self.root, 0, None)
+
+    def generate(self, schema: Schema, depth: int, parent_tag: Optional[str]) -> Any:
+        if schema.nullable and (depth >= self.config.max_depth or self.random.random() < self.config.null_rate):
+            return None
+
+        form = schema.form()
+        if form == Form.REF:
+            return self.generate(self.root.definitions[schema.ref], depth, None)
+
+        if self.config.mutation_rate and self.random.random() < self.config.mutation_rate:
+            mutations = [m for m in _applicable_mutations(schema, form, parent_tag) if m in self.mutations]
+            if mutations:
+                return self.mutate(schema, form, depth, parent_tag, self.random.choice(mutations))
+
+        return self.generate_valid(schema, form, depth, parent_tag)
+
+    def generate_valid(self, schema: Schema, form: Form, depth: int, parent_tag: Optional[str]) -> Any:
+        if form == Form.EMPTY:
+            return self.random.choice([
+                None,
+                self.random.random() < 0.5,
+                self.random.randint(-1000, 1000),
+                self.string(),
+            ])
+        elif form == Form.TYPE:
+            if schema.type == "boolean":
+                return self.random.random() < 0.5
+            elif schema.type == "float32" or schema.type == "float64":
+                return self.random.uniform(-1e6, 1e6)
+            elif schema.type in _INT_RANGES:
+                return self.random.randint(*_INT_RANGES[schema.type])
+            elif schema.type == "string":
+                return self.string()
+            else:
+                return strict_rfc3339.timestamp_to_rfc3339_utcoffset(self.random.randint(0, _MAX_TIMESTAMP))
+        elif form == Form.ENUM:
+            return self.random.choice(schema.enum)
+        elif form == Form.ELEMENTS:
+            return [self.generate(schema.elements, depth + 1, None) for _ in range(self.count(depth))]
+        elif form == Form.PROPERTIES:
+            out = {}
+            for k, v in (schema.properties or {}).items():
+                out[k] = self.generate(v, depth + 1, None)
+            for k, v in (schema.optional_properties or {}).items():
+                if depth < self.config.max_depth and self.random.random() < self.config.optional_rate:
+                    out[k] = self.generate(v, depth + 1, None)
+            return out
+        elif form == Form.VALUES:
+            return { self.string(): self.generate(schema.values, depth + 1, None) for _ in range(self.count(depth)) }
+        else:
+            tag = self.random.choice(list(schema.mapping))
+            out = { schema.discriminator: tag }
+            out.update(self.generate(schema.mapping[tag], depth, schema.discriminator))
+            return out
+
+    def mutate(self, schema: Schema, form: Form, depth: int, parent_tag: Optional[str], mutation: Mutation) -> Any:
+        if mutation == Mutation.WRONG_TYPE:
+            if form == Form.TYPE and schema.type != "boolean":
+                return self.random.random() < 0.5
+            elif form == Form.ELEMENTS:
+                return {}
+            elif form in (Form.PROPERTIES, Form.VALUES, Form.DISCRIMINATOR):
+                return []
+            else:
+                return self.random.randint(-1000, 1000)
+        elif mutation == Mutation.OUT_OF_RANGE:
+            low, high = _INT_RANGES[schema.type]
+            return self.random.choice([low - 1, high + 1, 0.5])
+        elif mutation == Mutation.NOT_IN_ENUM:
+            return max(schema.enum, key=len) + self.random.choice(string.ascii_letters)
+        elif mutation == Mutation.BAD_TIMESTAMP:
+            return self.string() + "Z"
+        elif mutation == Mutation.MISSING_PROPERTY:
+            out = self.generate_valid(schema, form, depth, parent_tag)
+            del out[self.random.choice(list(schema.properties))]
+            return out
+        elif mutation == Mutation.ADDITIONAL_PROPERTY:
+            out = self.generate_valid(schema, form, depth, parent_tag)
+            key = self.string()
+            while key in (schema.properties or {}) or key in (schema.optional_properties or {}) or key == parent_tag:
+                key += self.random.choice(string.ascii_letters)
+            out[key] = None
+            return out
+        else:
+            out = self.generate_valid(schema, form, depth, parent_tag)
+            out[schema.discriminator] = max(schema.mapping, key=len) + self.random.choice(string.ascii_letters)
+            return out
+
+    def count(self, depth: int) -> int:
+        if depth >= self.config.max_depth:
+            return 0
+        return self.random.randint(0, self.config.max_elements)
+
+    def string(self) -> str:
+        length = self.random.randint(0, self.config.max_string_length)
+        return "".join(self.random.choice(string.ascii_letters) for _ in range(length))
+
+def _applicable_mutations(schema: Schema, form: Form, parent_tag: Optional[str]) -> List[Mutation]:
+    mutations = []
+    if form != Form.EMPTY and parent_tag is None:
+        # Mapping values are merged into the object holding the tag, so they
+        # must remain objects.
+        mutations.append(Mutation.WRONG_TYPE)
+    if form == Form.TYPE and schema.type in _INT_RANGES:
+        mutations.append(Mutation.OUT_OF_RANGE)
+    if form == Form.TYPE and schema.type == "timestamp":
+        mutations.append(Mutation.BAD_TIMESTAMP)
+    if form == Form.ENUM:
+        mutations.append(Mutation.NOT_IN_ENUM)
+    if form == Form.PROPERTIES and schema.properties:
+        mutations.append(Mutation.MISSING_PROPERTY)
+    if form == Form.PROPERTIES and not schema.additional_properties:
+        mutations.append(Mutation.ADDITIONAL_PROPERTY)
+    if form == Form.DISCRIMINATOR:
+        mutations.append(Mutation.BAD_DISCRIMINATOR)
+    return mutations
@@ -0,0 +1,206 @@
+import strict_rfc3339
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .generate import _INT_RANGES
+from .optimize import _children
+from .schema import Form, Schema
+from .validate import ValidationOptions, _is_mapping, _is_sequence
+
+def match_all(**kwargs) -> List[Schema]:
+    """
+    Returns the schemas, out of several candidates, that an instance satisfies.
+    This gives the same answer as calling :func:`validate` once per schema, but
+    walks the instance only once.
+
+    Provide the candidate schemas as a list using the `schemas` keyword
+    argument, and the instance with the `instance` keyword argument.
+    Optionally, you can pass :class:`ValidationOptions` with the `options`
+    keyword argument; only ``container_protocols`` is taken into account.
+
+    Candidates are checked side by side, and are dropped as soon as they fail.
+    Subschemas that are the same object are only checked once per part of the
+    instance. To also share work between subschemas that are merely
+    structurally identical, such as those of successive versions of a schema,
+    pass the candidates through :func:`optimize_all` first.
+
+    >>> import jtd
+    >>> v1 = jtd.Schema.from_dict({ 'properties': { 'id': { 'type': 'string' }}})
+    >>> v2 = jtd.Schema.from_dict({ 'properties': { 'id': { 'type': 'uint32' }}})
+    >>> v3 = jtd.Schema.from_dict({ 'properties': { 'id': {} }})
+    >>> jtd.match_all(schemas=[v1, v2, v3], instance={ 'id': 'foo' }) == [v1, v3]
+    True
+    """
+
+    schemas = kwargs['schemas']
+    matcher = _Matcher(kwargs.get('options', ValidationOptions()))
+
+    keys = []
+    candidates = {}
+    for schema in schemas:
+        key = matcher.key(schema, schema, None)
+        candidates[key] = (schema, schema, None)
+        keys.append(key)
+
+    accepted = matcher.match(candidates, kwargs['instance'])
+    return [schema for schema, key in zip(schemas, keys) if key in accepted]
+
+def match_any(**kwargs) -> Optional[Schema]:
+    """
+    Returns the first schema, out of several candidates, that an instance
+    satisfies, or ``None`` if it satisfies none of them. Takes the same
+    arguments as :func:`match_all`.
+
+    >>> import jtd
+    >>> v1 = jtd.Schema.from_dict({ 'properties': { 'id': { 'type': 'string' }}})
+    >>> v2 = jtd.Schema.from_dict({ 'properties': { 'id': { 'type': 'uint32' }}})
+    >>> jtd.match_any(schemas=[v1, v2], instance={ 'id': 3 }) is v2
+    True
+    >>> jtd.match_any(schemas=[v1, v2], instance={ 'id': None }) is None
+    True
+    """
+
+    matches = match_all(**kwargs)
+    if matches:
+        return matches[0]
+    return None
+
+# A candidate is a schema, the root schema its refs resolve against, and the
+# discriminator tag of its parent, if any. Candidates are keyed so that
+# identical ones are checked only once: the root only matters if the schema
+# contains refs.
+_Candidate = Tuple[Schema, Schema, Optional[str]]
+_Key = Tuple[int, Optional[int], Optional[str]]
+
+class _Matcher:
+    def __init__(self, config: ValidationOptions):
+        self.config = config
+        self.uses_refs_memo: Dict[int, bool] = {}
+
+    def key(self, schema: Schema, root: Schema, parent_tag: Optional[str]) -> _Key:
+        return (id(schema), id(root) if self.uses_refs(schema) else None, parent_tag)
+
+    def uses_refs(self, schema: Schema) -> bool:
+        if id(schema) not in self.uses_refs_memo:
+            self.uses_refs_memo[id(schema)] = schema.ref is not None or any(self.uses_refs(c) for c in _children(schema))
+        return self.uses_refs_memo[id(schema)]
+
+    def match(self, candidates: Dict[_Key, _Candidate], instance: Any) -> Set[_Key]:
+        accepted = set()
+
+        # Follow refs first, since candidates that look different may point to
+        # the same definition.
+        resolved: Dict[_Key, _Candidate] = {}
+        owners: Dict[_Key, List[_Key]] = {}
+        for key, (schema, root, parent_tag) in candidates.items():
+            seen = set()
+            while True:
+                if schema.nullable and instance is None:
+                    accepted.add(key)
+                    break
+
+                if schema.ref is None:
+                    resolved_key = self.key(schema, root, parent_tag)
+                    resolved[resolved_key] = (schema, root, parent_tag)
+                    owners.setdefault(resolved_key, []).append(key)
+                    break
+
+                if schema.ref in seen:
+                    # A cycle of refs describes no instance at all.
+                    break
+
+                seen.add(schema.ref)
+                schema, parent_tag = root.definitions[schema.ref], None
+
+        alive = set()
+        elements: Dict[_Key, _Candidate] = {}
+        objects: Dict[_Key, _Candidate] = {}
+        for key, (schema, root, parent_tag) in resolved.items():
+            form = schema.form()
+            if form == Form.EMPTY:
+                alive.add(key)
+            elif form == Form.TYPE:
+                if _type_matches(schema.type, instance):
+                    alive.add(key)
+            elif form == Form.ENUM:
+                if instance in schema.enum:
+                    alive.add(key)
+            elif form == Form.ELEMENTS:
+                if type(instance) is list or _is_sequence(self.config, instance):
+                    elements[key] = (schema, root, parent_tag)
+            elif type(instance) is dict or _is_mapping(self.config, instance):
+                if form == Form.DISCRIMINATOR:
+                    tag = instance.get(schema.discriminator)
+                    if type(tag) is str and tag in schema.mapping:
+                        if _properties_match(schema.mapping[tag], instance, schema.discriminator):
+                            objects[key] = (schema.mapping[tag], root, schema.discriminator)
+                elif form == Form.VALUES or _properties_match(schema, instance, parent_tag):
+                    objects[key] = (schema, root, parent_tag)
+
+        if elements:
+            alive |= self.match_entries(elements, enumerate(instance))
+        if objects:
+            alive |= self.match_entries(objects, instance.items())
+
+        for key in alive:
+            accepted.update(owners[key])
+        return accepted
+
+    def match_entries(self, candidates: Dict[_Key, _Candidate], entries) -> Set[_Key]:
+        alive = set(candidates)
+        for k, v in entries:
+            children: Dict[_Key, _Candidate] = {}
+            wanted: Dict[_Key, _Key] = {}
+            for key in alive:
+                schema, root, _ = candidates[key]
+
+                if schema.elements is not None:
+                    child = schema.elements
+                elif schema.values is not None:
+                    child = schema.values
+                elif k in (schema.properties or {}):
+                    child = schema.properties[k]
+                elif k in (schema.optional_properties or {}):
+                    child = schema.optional_properties[k]
+                else:
+                    continue
+
+                child_key = self.key(child, root, None)
+                children[child_key] = (child, root, None)
+                wanted[key] = child_key
+
+            if children:
+                accepted = self.match(children, v)
+                alive.difference_update(key for key, child_key in wanted.items() if child_key not in accepted)
+
+                if not alive:
+                    break
+
+        return alive
+
+def _properties_match(schema: Schema, instance: Any, parent_tag: Optional[str]) -> bool:
+    for k in (schema.properties or {}):
+        if k not in instance:
+            return False
+
+    if not schema.additional_properties:
+        for k in instance:
+            in_props = k in (schema.properties or {})
+            in_opt_props = k in (schema.optional_properties or {})
+
+            if not in_props and not in_opt_props and k != parent_tag:
+                return False
+
+    return True
+
+def _type_matches(type_name: str, instance: Any) -> bool:
+    if type_name == "boolean":
+        return type(instance) is bool
+    elif type_name == "float32" or type_name == "float64":
+        return type(instance) in [int, float]
+    elif type_name in _INT_RANGES:
+        low, high = _INT_RANGES[type_name]
+        return type(instance) in [int, float] and int(instance) == instance and low <= instance <= high
+    elif type_name == "string":
+        return type(instance) is str
+    else:
+        return type(instance) is str and strict_rfc3339.validate_rfc3339(instance)
@@ -0,0 +1,228 @@
+import dataclasses
+import json
+from typing import Any, Dict, List, Optional, Set
+
+from .schema import Form, Schema
+
+@dataclasses.dataclass
+class OptimizationResult:
+    """Represents the outcome of :func:`optimize`."""
+
+    schema: Schema
+    """The optimized schema."""
+
+    nodes_before: int
+    """Number of distinct :class:`Schema` objects in the input schema."""
+
+    nodes_after: int
+    """Number of distinct :class:`Schema` objects in the optimized schema."""
+
+def optimize(schema: Schema) -> OptimizationResult:
+    """
+    Rewrites a schema into an equivalent one that takes less memory and fewer
+    steps to validate against. The input schema is not modified, and is assumed
+    to have passed :func:`Schema.validate`.
+
+    The optimized schema:
+
+    * Shares a single :class:`Schema` object between all structurally identical
+      subschemas. Because of this, the optimized schema should not be modified
+      in place.
+    * Inlines refs to definitions that are not recursive and that are either
+      used only once, or that are of the empty, type, or enum form. Definitions
+      that are no longer referred to are dropped.
+    * Drops keywords that have no effect, such as ``nullable: false`` or
+      ``additionalProperties: false``.
+
+    Validating against the optimized schema returns the same errors as
+    validating against the input schema, except for errors raised from within
+    an inlined definition: a ``schema_path`` that would have been
+    ``['definitions', name, ...]`` is instead the path to the ``ref`` that was
+    inlined, followed by ``...``. Inlined refs also no longer count towards
+    ``max_depth``.
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({
+    ...     'definitions': { 'id': { 'type': 'string' }},
+    ...     'properties': {
+    ...         'a': { 'ref': 'id' },
+    ...         'b': { 'type': 'string' },
+    ...         'c': { 'elements': { 'type': 'string', 'nullable': False }},
+    ...     },
+    ... })
+    >>> result = jtd.optimize(schema)
+    >>> result.nodes_before, result.nodes_after
+    (6, 3)
+    >>> result.schema.properties['a'] is result.schema.properties['b']
+    True
+    >>> result.schema.definitions is None
+    True
+    """
+
+    return _Optimizer(schema, {}).run()
+
+def optimize_all(schemas: List[Schema]) -> List[OptimizationResult]:
+    """
+    Optimizes several schemas like :func:`optimize`, but also shares
+    subschemas between them. This is useful for families of closely related
+    schemas, such as successive versions of the same event type.
+
+    >>> import jtd
+    >>> v1 = jtd.Schema.from_dict({ 'properties': { 'at': { 'type': 'timestamp' }}})
+    >>> v2 = jtd.Schema.from_dict({ 'properties': { 'at': { 'type': 'timestamp' }, 'id': { 'type': 'string' }}})
+    >>> r1, r2 = jtd.optimize_all([v1, v2])
+    >>> r1.schema.properties['at'] is r2.schema.properties['at']
+    True
+    """
+
+    interned: Dict[Any, Schema] = {}
+    return [_Optimizer(schema, interned).run() for schema in schemas]
+
+class _Optimizer:
+    def __init__(self, root: Schema, interned: Dict[Any, Schema]):
+        self.root = root
+        self.definitions = root.definitions or {}
+        self.interned = interned
+        self.memo: Dict[int, Schema] = {}
+        self.remaining_refs: Set[str] = set()
+
+        uses: Dict[str, int] = {}
+        dependencies: Dict[str, Set[str]] = {}
+        for node in _walk(root, follow_definitions=False):
+            if node.ref is not None:
+                uses[node.ref] = uses.get(node.ref, 0) + 1
+        for name, definition in self.definitions.items():
+            dependencies[name] = set()
+            for node in _walk(definition, follow_definitions=False):
+                if node.ref is not None:
+                    uses[node.ref] = uses.get(node.ref, 0) + 1
+                    dependencies[name].add(node.ref)
+
+        self.inline = set()
+        for name, definition in self.definitions.items():
+            if _is_recursive(name, dependencies):
+                continue
+
+            if uses.get(name, 0) == 1 or definition.form() in (Form.EMPTY, Form.TYPE, Form.ENUM):
+                self.inline.add(name)
+
+    def run(self) -> OptimizationResult:
+        nodes_before = _count(self.root)
+
+        root = self.rewrite(dataclasses.replace(self.root, definitions=None))
+
+        definitions = {}
+        for name, definition in self.definitions.items():
+            definitions[name] = self.rewrite(definition)
+        for name in self.inline - self.remaining_refs:
+            del definitions[name]
+
+        if definitions:
+            root = dataclasses.replace(root, definitions=definitions)
+
+        return OptimizationResult(schema=root, nodes_before=nodes_before, nodes_after=_count(root))
+
+    def rewrite(self, schema: Schema) -> Schema:
+        if id(schema) in self.memo:
+            return self.memo[id(schema)]
+
+        if schema.ref is not None and schema.ref in self.inline and schema.metadata is None:
+            result = self.rewrite(self.definitions[schema.ref])
+            if schema.nullable and not result.nullable:
+                result = self.intern(dataclasses.replace(result, nullable=True))
+        else:
+            if schema.ref is not None:
+                self.remaining_refs.add(schema.ref)
+
+            result = self.intern(dataclasses.replace(
+                schema,
+                nullable=schema.nullable or None,
+                elements=self.rewrite_optional(schema.elements),
+                properties=self.rewrite_dict(schema.properties),
+                optional_properties=self.rewrite_dict(schema.optional_properties),
+                additional_properties=schema.additional_properties or None,
+                values=self.rewrite_optional(schema.values),
+                mapping=self.rewrite_dict(schema.mapping),
+            ))
+
+        self.memo[id(schema)] = result
+        return result
+
+    def rewrite_optional(self, schema: Optional[Schema]) -> Optional[Schema]:
+        if schema is None:
+            return None
+        return self.rewrite(schema)
+
+    def rewrite_dict(self, schemas: Optional[Dict[str, Schema]]) -> Optional[Dict[str, Schema]]:
+        if schemas is None:
+            return None
+        return { k: self.rewrite(v) for k, v in schemas.items() }
+
+    def intern(self, schema: Schema) -> Schema:
+        # Children have already been interned, so their identity stands in for
+        # their structure.
+        key = (
+            json.dumps(schema.metadata, sort_keys=True, default=repr),
+            schema.nullable,
+            schema.ref,
+            schema.type,
+            None if schema.enum is None else tuple(schema.enum),
+            id(schema.elements),
+            _dict_key(schema.properties),
+            _dict_key(schema.optional_properties),
+            schema.additional_properties,
+            id(schema.values),
+            schema.discriminator,
+            _dict_key(schema.mapping),
+        )
+
+        return self.interned.setdefault(key, schema)
+
+def _dict_key(schemas: Optional[Dict[str, Schema]]):
+    if schemas is None:
+        return None
+    return tuple((k, id(v)) for k, v in schemas.items())
+
+def _children(schema: Schema):
+    if schema.elements is not None:
+        yield schema.elements
+    if schema.properties is not None:
+        yield from schema.properties.values()
+    if schema.optional_properties is not None:
+        yield from schema.optional_properties.values()
+    if schema.values is not None:
+        yield schema.values
+    if schema.mapping is not None:
+        yield from schema.mapping.values()
+
+def _walk(schema: Schema, follow_definitions: bool):
+    seen = set()
+    stack = [schema]
+    if follow_definitions and schema.definitions is not None:
+        stack.extend(schema.definitions.values())
+
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+
+        seen.add(id(node))
+        yield node
+        stack.extend(_children(node))
+
+def _count(schema: Schema) -> int:
+    return sum(1 for _ in _walk(schema, follow_definitions=True))
+
+def _is_recursive(name: str, dependencies: Dict[str, Set[str]]) -> bool:
+    seen = set()
+    stack = list(dependencies[name])
+    while stack:
+        dependency = stack.pop()
+        if dependency == name:
+            return True
+        if dependency in seen or dependency not in dependencies:
+            continue
+
+        seen.add(dependency)
+        stack.extend(dependencies[dependency])
+    return False
@@ -0,0 +1,201 @@
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+from .schema import Form, Schema
+from .validate import MaxDepthExceededError, ValidationError, ValidationOptions, _MaxErrorsReached, _ValidationState, _is_mapping, _is_sequence, _parse_pointer, _validate_with_state
+
+def revalidate(**kwargs) -> List[ValidationError]:
+    """
+    Revalidates an instance after a JSON Patch (RFC 6902) has been applied to
+    it, and returns a list of validation errors.
+
+    Provide the schema using the `schema` keyword argument, the already-patched
+    instance with the `instance` keyword argument, and the list of patch
+    operations that were applied with the `patch` keyword argument. Optionally,
+    you can pass :class:`ValidationOptions` with the `options` keyword argument.
+
+    The instance must have been valid against the schema before the patch was
+    applied. Under that assumption, only the parts of the instance touched by
+    the patch are revisited, along with the checks their parents perform (such
+    as required properties, ``additionalProperties``, and discriminator tags),
+    and the result is the same list of errors :func:`validate` would return.
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({
+    ...     'properties': {
+    ...         'name': { 'type': 'string' },
+    ...         'tags': { 'elements': { 'type': 'string' }},
+    ...     },
+    ... })
+    >>> instance = { 'name': 'foo', 'tags': ['a', 'b', None] }
+    >>> patch = [{ 'op': 'add', 'path': '/tags/-', 'value': None }]
+    >>> jtd.revalidate(schema=schema, instance=instance, patch=patch)
+    [ValidationError(instance_path=['tags', '2'], schema_path=['properties', 'tags', 'elements', 'type'])]
+    """
+
+    tree = _PatchTree()
+    for operation in kwargs['patch']:
+        if operation['op'] == 'test':
+            continue
+
+        # Every operation but replace inserts or removes a value, which shifts
+        # the later elements of an array.
+        shifts = operation['op'] != 'replace'
+
+        if operation['op'] == 'move':
+            tree.add(_parse_pointer(operation['from']), shifts)
+        tree.add(_parse_pointer(operation['path']), shifts)
+
+    state = _ValidationState(
+        config=kwargs.get('options', ValidationOptions()),
+        root_schema=kwargs['schema'],
+        instance_tokens=[],
+        schema_tokens=[[]],
+        errors=[],
+    )
+
+    try:
+        _revalidate_with_state(state, kwargs['schema'], kwargs['instance'], None, tree)
+    except _MaxErrorsReached:
+        pass
+
+    return state.errors
+
+@dataclasses.dataclass
+class _PatchTree:
+    whole: bool = False
+    appends: int = 0
+    shifted: bool = False
+    indexed: int = 0
+    children: Dict[str, '_PatchTree'] = dataclasses.field(default_factory=dict)
+
+    def add(self, tokens: List[str], shifts: bool):
+        parent = None
+        node = self
+        for token in tokens:
+            if node.whole:
+                return
+
+            if token.isdecimal():
+                node.indexed += 1
+
+            parent = node
+            node = node.children.setdefault(token, _PatchTree())
+
+        node.whole = True
+        node.children.clear()
+
+        if parent is None:
+            return
+
+        # "-" refers to the end of an array, so keep count of how many elements
+        # were appended. For objects, "-" is just an ordinary member name.
+        if tokens[-1] == "-":
+            parent.appends += 1
+        elif shifts and tokens[-1].isdecimal():
+            parent.shifted = True
+
+def _touched_keys(instance: Dict[str, Any], tree: _PatchTree) -> List[str]:
+    keys = [k for k in tree.children if k in instance]
+    if len(keys) > 1:
+        # Errors must come out in the same order as a full validation, which
+        # follows the order of the instance.
+        keys = [k for k in instance if k in tree.children]
+    return keys
+
+def _revalidate_with_state(state: _ValidationState, schema: Schema, instance: Any, parent_tag: Optional[str], tree: _PatchTree):
+    if tree.whole:
+        _validate_with_state(state, schema, instance, parent_tag)
+        return
+
+    state.nodes_visited += 1
+    if state.nodes_visited == state.budget_checkpoint:
+        state.check_budget()
+
+    if schema.nullable and instance is None:
+        return
+
+    form = schema.form()
+    if form == Form.REF:
+        if len(state.schema_tokens) == state.config.max_depth:
+            raise MaxDepthExceededError()
+
+        state.schema_tokens.append(["definitions", schema.ref])
+        _revalidate_with_state(state, state.root_schema.definitions[schema.ref], instance, None, tree)
+        state.schema_tokens.pop()
+    elif form == Form.ELEMENTS and (type(instance) is list or _is_sequence(state.config, instance)):
+        indices = {}
+        for token, child in tree.children.items():
+            if token.isdecimal() and int(token) < len(instance):
+                indices[int(token)] = child
+
+        # Indices are recorded as they were when each operation ran. Once an
+        # insert or removal is combined with other operations on the same
+        # array, they no longer line up with the final array.
+        if (tree.shifted and tree.indexed > 1) or (tree.appends and indices):
+            _validate_with_state(state, schema, instance, parent_tag)
+            return
+
+        if tree.appends:
+            for i in range(max(0, len(instance) - tree.appends), len(instance)):
+                indices[i] = _PatchTree(whole=True)
+
+        state.push_schema_token("elements")
+        for i in sorted(indices):
+            state.push_instance_token(str(i))
+            _revalidate_with_state(state, schema.elements, instance[i], None, indices[i])
+            state.pop_instance_token()
+        state.pop_schema_token()
+    elif form == Form.PROPERTIES and (type(instance) is dict or _is_mapping(state.config, instance)):
+        state.push_schema_token("properties")
+        for k, v in (schema.properties or {}).items():
+            state.push_schema_token(k)
+            if k in instance:
+                if k in tree.children:
+                    state.push_instance_token(k)
+                    _revalidate_with_state(state, v, instance[k], None, tree.children[k])
+                    state.pop_instance_token()
+            else:
+                state.push_error()
+            state.pop_schema_token()
+        state.pop_schema_token()
+
+        state.push_schema_token("optionalProperties")
+        for k, v in (schema.optional_properties or {}).items():
+            if k in instance and k in tree.children:
+                state.push_schema_token(k)
+                state.push_instance_token(k)
+                _revalidate_with_state(state, v, instance[k], None, tree.children[k])
+                state.pop_instance_token()
+                state.pop_schema_token()
+        state.pop_schema_token()
+
+        if not schema.additional_properties:
+            for k in _touched_keys(instance, tree):
+                in_props = k in (schema.properties or {})
+                in_opt_props = k in (schema.optional_properties or {})
+
+                if not in_props and not in_opt_props and k != parent_tag:
+                    state.push_instance_token(k)
+                    state.push_error()
+                    state.pop_instance_token()
+    elif form == Form.VALUES and (type(instance) is dict or _is_mapping(state.config, instance)):
+        state.push_schema_token("values")
+        for k in _touched_keys(instance, tree):
+            state.push_instance_token(k)
+            _revalidate_with_state(state, schema.values, instance[k], None, tree.children[k])
+            state.pop_instance_token()
+        state.pop_schema_token()
+    elif form == Form.DISCRIMINATOR and (type(instance) is dict or _is_mapping(state.config, instance)) and schema.discriminator not in tree.children \
+            and type(instance.get(schema.discriminator)) is str and instance[schema.discriminator] in schema.mapping:
+        tag = instance[schema.discriminator]
+
+        state.push_schema_token("mapping")
+        state.push_schema_token(tag)
+        _revalidate_with_state(state, schema.mapping[tag], instance, schema.discriminator, tree)
+        state.pop_schema_token()
+        state.pop_schema_token()
+    else:
+        # Leaf forms, a changed discriminator tag, or an instance whose shape
+        # no longer matches the schema: all of these are checked in full.
+        _validate_with_state(state, schema, instance, parent_tag)
@@ -18,6 +18,16 @@ class Form(enum.Enum):
     VALUES = enum.auto()
     DISCRIMINATOR = enum.auto()
 
+@dataclasses.dataclass
+class SchemaError:
+    """Represents a single problem with a schema, as found by :func:`Schema.check`."""
+
+    path: List[str]
+    """Path to the part of the schema that has the problem."""
+
+    message: str
+    """Description of the problem."""
+
 @dataclasses.dataclass
 class Schema:
     """
@@ -71,7 +81,7 @@ class Schema:
     mapping: Optional[Dict[str, 'Schema']]
     """Describes the data, depending on the value of the "tag" property of an object."""
 
-    _KEYWORDS = [
+    _KEYWORDS = frozenset([
         "metadata",
         "nullable",
         "definitions",
@@ -85,9 +95,9 @@ class Schema:
         "values",
         "discriminator",
         "mapping",
-    ]
+    ])
 
-    _TYPE_VALUES = [
+    _TYPE_VALUES = frozenset([
         'boolean',
         'int8',
         'uint8',
@@ -99,32 +109,44 @@ class Schema:
         'float64',
         'string',
         'timestamp',
-    ]
-
-    _VALID_FORMS = [
+    ])
+
+    # Bits of a form signature, one per form-determining keyword.
+    _REF = 1 << 0
+    _TYPE = 1 << 1
+    _ENUM = 1 << 2
+    _ELEMENTS = 1 << 3
+    _PROPERTIES = 1 << 4
+    _OPTIONAL_PROPERTIES = 1 << 5
+    _ADDITIONAL_PROPERTIES = 1 << 6
+    _VALUES = 1 << 7
+    _DISCRIMINATOR = 1 << 8
+    _MAPPING = 1 << 9
+
+    _VALID_FORMS = frozenset([
         # Empty form
-        [False, False, False, False, False, False, False, False, False, False],
+        0,
         # Ref form
-        [True, False, False, False, False, False, False, False, False, False],
+        _REF,
         # Type form
-        [False, True, False, False, False, False, False, False, False, False],
+        _TYPE,
         # Enum form
-        [False, False, True, False, False, False, False, False, False, False],
+        _ENUM,
         # Elements form
-        [False, False, False, True, False, False, False, False, False, False],
+        _ELEMENTS,
         # Properties form -- properties or optional properties or both, and
         # never additional properties on its own
-        [False, False, False, False, True, False, False, False, False, False],
-        [False, False, False, False, False, True, False, False, False, False],
-        [False, False, False, False, True, True, False, False, False, False],
-        [False, False, False, False, True, False, True, False, False, False],
-        [False, False, False, False, False, True, True, False, False, False],
-        [False, False, False, False, True, True, True, False, False, False],
+        _PROPERTIES,
+        _OPTIONAL_PROPERTIES,
+        _PROPERTIES | _OPTIONAL_PROPERTIES,
+        _PROPERTIES | _ADDITIONAL_PROPERTIES,
+        _OPTIONAL_PROPERTIES | _ADDITIONAL_PROPERTIES,
+        _PROPERTIES | _OPTIONAL_PROPERTIES | _ADDITIONAL_PROPERTIES,
         # Values form
-        [False, False, False, False, False, False, False, True, False, False],
+        _VALUES,
         # Discriminator form
-        [False, False, False, False, False, False, False, False, True, True],
-    ]
+        _DISCRIMINATOR | _MAPPING,
+    ])
 
     @classmethod
     def from_dict(cls, dict: Dict[str, Any]) -> 'Schema':
@@ -185,7 +207,8 @@ class Schema:
     def validate(self, root=None):
         """
         Checks whether a schema satisfies the semantic rules of JSON Typedef,
-        such as ensuring that all refs have a corresponding definition.
+        such as ensuring that all refs have a corresponding definition. Raises
+        a ``TypeError`` describing the first problem :func:`check` finds.
 
         >>> import jtd
         >>> schema = jtd.Schema.from_dict({ 'ref': 'xxx' })
@@ -195,103 +218,155 @@ class Schema:
         TypeError: ref but no definitions
         """
 
+        errors = self.check(root)
+        if errors:
+            raise TypeError(errors[0].message)
+
+    def check(self, root=None) -> List['SchemaError']:
+        """
+        Checks whether a schema satisfies the semantic rules of JSON Typedef,
+        and returns a list of every problem found, rather than stopping at the
+        first one like :func:`validate`.
+
+        The schema is walked in a single pass without recursion, so arbitrarily
+        deep schemas can be checked.
+
+        >>> import jtd
+        >>> schema = jtd.Schema.from_dict({
+        ...     'properties': {
+        ...         'a': { 'ref': 'xxx' },
+        ...         'b': { 'type': 'nonsense' },
+        ...     },
+        ... })
+        >>> schema.check()
+        [SchemaError(path=['properties', 'a', 'ref'], message='ref but no definitions'), SchemaError(path=['properties', 'b', 'type'], message='type not valid string value')]
+        """
+
         if root is None:
             root = self
 
-        if self.definitions is not None:
-            if self is not root:
-                raise TypeError("non-root definitions")
+        definitions = root.definitions if type(root.definitions) is dict else None
+        type_values = self._TYPE_VALUES
+        valid_forms = self._VALID_FORMS
 
-            for v in self.definitions.values():
-                v.validate(root)
+        errors = []
 
-        if self.nullable is not None and type(self.nullable) is not bool:
-            raise TypeError("nullable not bool")
+        # Paths are kept as (parent path, token, ...) tuples, and are only
+        # turned into lists when there is a problem to report.
+        stack = [(self, ())]
 
-        if self.ref is not None:
-            if type(self.ref) is not str:
-                raise TypeError("ref not string")
+        while stack:
+            node, path = stack.pop()
+            children = []
+            form_signature = 0
 
-            if type(root.definitions) is not dict:
-                raise TypeError("ref but no definitions")
+            if node.definitions is not None:
+                if node is not root:
+                    errors.append(_schema_error(path, "definitions", "non-root definitions"))
 
-            if self.ref not in root.definitions:
-                raise TypeError("ref to non-existent definition")
+                for k, v in node.definitions.items():
+                    children.append((v, (path, "definitions", k)))
 
-        if self.type is not None and self.type not in self._TYPE_VALUES:
-            raise TypeError("type not valid string value")
+            if node.nullable is not None and type(node.nullable) is not bool:
+                errors.append(_schema_error(path, "nullable", "nullable not bool"))
 
-        if self.enum is not None:
-            if type(self.enum) is not list:
-                raise TypeError("enum not list")
+            ref = node.ref
+            if ref is not None:
+                form_signature |= self._REF
 
-            if len(self.enum) == 0:
-                raise TypeError("enum is empty")
+                if type(ref) is not str:
+                    errors.append(_schema_error(path, "ref", "ref not string"))
+                elif definitions is None:
+                    errors.append(_schema_error(path, "ref", "ref but no definitions"))
+                elif ref not in definitions:
+                    errors.append(_schema_error(path, "ref", "ref to non-existent definition"))
 
-            for v in self.enum:
-                if type(v) is not str:
-                    raise TypeError("enum not list of strings")
+            if node.type is not None:
+                form_signature |= self._TYPE
 
-            if len(self.enum) != len(set(self.enum)):
-                raise TypeError("enum contains duplicates")
+                if type(node.type) is not str or node.type not in type_values:
+                    errors.append(_schema_error(path, "type", "type not valid string value"))
 
-        if self.elements is not None:
-            self.elements.validate(root)
+            enum = node.enum
+            if enum is not None:
+                form_signature |= self._ENUM
 
-        if self.properties is not None:
-            for v in self.properties.values():
-                v.validate(root)
+                if type(enum) is not list:
+                    errors.append(_schema_error(path, "enum", "enum not list"))
+                elif len(enum) == 0:
+                    errors.append(_schema_error(path, "enum", "enum is empty"))
+                elif any(type(v) is not str for v in enum):
+                    errors.append(_schema_error(path, "enum", "enum not list of strings"))
+                elif len(enum) != len(set(enum)):
+                    errors.append(_schema_error(path, "enum", "enum contains duplicates"))
 
-        if self.optional_properties is not None:
-            for v in self.optional_properties.values():
-                v.validate(root)
+            if node.elements is not None:
+                form_signature |= self._ELEMENTS
+                children.append((node.elements, (path, "elements")))
 
-        if self.properties is not None and self.optional_properties is not None:
-            if set(self.properties).intersection(self.optional_properties):
-                raise TypeError("properties shares keys with optional_properties")
+            properties = node.properties
+            if properties is not None:
+                form_signature |= self._PROPERTIES
 
-        if self.additional_properties is not None:
-            if type(self.additional_properties) is not str:
-                raise TypeError("additional_properties not string")
+                for k, v in properties.items():
+                    children.append((v, (path, "properties", k)))
 
-        if self.values is not None:
-            self.values.validate(root)
+            optional_properties = node.optional_properties
+            if optional_properties is not None:
+                form_signature |= self._OPTIONAL_PROPERTIES
 
-        if self.discriminator is not None:
-            if type(self.discriminator) is not str:
-                raise TypeError("discriminator not string")
+                for k, v in optional_properties.items():
+                    children.append((v, (path, "optionalProperties", k)))
+
+                if properties is not None and not properties.keys().isdisjoint(optional_properties):
+                    errors.append(_schema_error(path, "optionalProperties", "properties shares keys with optional_properties"))
+
+            if node.additional_properties is not None:
+                form_signature |= self._ADDITIONAL_PROPERTIES
+
+                if type(node.additional_properties) is not bool:
+                    errors.append(_schema_error(path, "additionalProperties", "additional_properties not bool"))
 
-        if self.mapping is not None:
-            for v in self.mapping.values():
-                v.validate(root)
+            if node.values is not None:
+                form_signature |= self._VALUES
+                children.append((node.values, (path, "values")))
 
-                if v.nullable:
-                    raise TypeError("mapping value is nullable")
+            discriminator = node.discriminator
+            if discriminator is not None:
+                form_signature |= self._DISCRIMINATOR
 
-                if v.form() != Form.PROPERTIES:
-                    raise TypeError("mapping value not of properties form")
+                if type(discriminator) is not str:
+                    errors.append(_schema_error(path, "discriminator", "discriminator not string"))
 
-                if self.discriminator in (v.properties or {}):
-                    raise TypeError("mapping properties redefines discriminator")
+            if node.mapping is not None:
+                form_signature |= self._MAPPING
 
-                if self.discriminator in (v.optional_properties or {}):
-                    raise TypeError("mapping optional_properties redefines discriminator")
+                for k, v in node.mapping.items():
+                    children.append((v, (path, "mapping", k)))
 
-        form_signature = [
-            self.ref is not None,
-            self.type is not None,
-            self.enum is not None,
-            self.elements is not None,
-            self.properties is not None,
-            self.optional_properties is not None,
-            self.additional_properties is not None,
-            self.values is not None,
-            self.discriminator is not None,
-            self.mapping is not None,
-        ]
+                    if v.nullable:
+                        errors.append(_schema_error(path, "mapping", k, "mapping value is nullable"))
 
-        if form_signature not in self._VALID_FORMS:
-            raise TypeError("invalid form")
+                    if v.form() != Form.PROPERTIES:
+                        errors.append(_schema_error(path, "mapping", k, "mapping value not of properties form"))
+
+                    if type(discriminator) is str:
+                        if discriminator in (v.properties or {}):
+                            errors.append(_schema_error(path, "mapping", k, "mapping properties redefines discriminator"))
+
+                        if discriminator in (v.optional_properties or {}):
+                            errors.append(_schema_error(path, "mapping", k, "mapping optional_properties redefines discriminator"))
+
+            if form_signature not in valid_forms:
+                errors.append(_schema_error(path, "invalid form"))
+
+            # Children are visited in reverse order of pushing, so push them
+            # backwards to report problems in the order they appear.
+            if children:
+                children.reverse()
+                stack.extend(children)
+
+        return errors
 
     def form(self) -> Form:
         """
@@ -322,3 +397,13 @@ class Schema:
         if self.discriminator is not None:
             return Form.DISCRIMINATOR
         return Form.EMPTY
+
+def _schema_error(path, *tokens_and_message) -> SchemaError:
+    segments = []
+    while path:
+        segments.append(path[1:])
+        path = path[0]
+
+    tokens = [token for segment in reversed(segments) for token in segment]
+    tokens.extend(tokens_and_message[:-1])
+    return SchemaError(path=tokens, message=tokens_and_message[-1])
@@ -0,0 +1,82 @@
+import io
+import json
+import unittest
+import jtd
+
+SCHEMA = {
+    'definitions': {
+        'node': {
+            'properties': {
+                'id': { 'type': 'int16' },
+                'children': { 'elements': { 'ref': 'node' }},
+            },
+            'optionalProperties': {
+                'parent': { 'ref': 'node', 'nullable': True },
+            },
+        },
+    },
+    'properties': {
+        'root': { 'ref': 'node' },
+        'at': { 'type': 'timestamp' },
+        'flag': { 'type': 'boolean', 'nullable': True },
+        'ratio': { 'type': 'float32' },
+        'color': { 'enum': ['red', 'green', 'blue'] },
+        'labels': { 'values': { 'type': 'string' }},
+        'anything': {},
+        'event': {
+            'discriminator': 'kind',
+            'mapping': {
+                'a': { 'properties': { 'x': { 'type': 'uint8' }}},
+                'b': { 'optionalProperties': { 'y': { 'type': 'uint32' }}, 'additionalProperties': True },
+            },
+        },
+    },
+}
+
+class TestGenerate(unittest.TestCase):
+    def test_valid(self):
+        schema = jtd.Schema.from_dict(SCHEMA)
+        for seed in range(50):
+            with self.subTest(seed):
+                instance = jtd.generate(schema=schema, seed=seed)
+                self.assertEqual([], jtd.validate(schema=schema, instance=instance))
+
+    def test_size(self):
+        schema = jtd.Schema.from_dict(SCHEMA)
+        options = jtd.GenerationOptions(max_depth=2, max_elements=3)
+        for seed in range(20):
+            instance = jtd.generate(schema=schema, seed=seed, options=options)
+            self.assertLessEqual(len(instance['root']['children']), 3)
+            for child in instance['root']['children']:
+                self.assertEqual([], child['children'])
+                self.assertNotIn('parent', child)
+
+    def test_mutations(self):
+        schema = jtd.Schema.from_dict(SCHEMA)
+        for mutation in jtd.Mutation:
+            with self.subTest(mutation):
+                options = jtd.GenerationOptions(mutation_rate=1, mutations=[mutation])
+                instance = jtd.generate(schema=schema, seed=0, options=options)
+                self.assertNotEqual([], jtd.validate(schema=schema, instance=instance))
+
+        options = jtd.GenerationOptions(mutation_rate=1, mutations=[])
+        for seed in range(20):
+            instance = jtd.generate(schema=schema, seed=seed, options=options)
+            self.assertEqual([], jtd.validate(schema=schema, instance=instance))
+
+        options = jtd.GenerationOptions(mutation_rate=0.2)
+        invalid = 0
+        for seed in range(50):
+            instance = jtd.generate(schema=schema, seed=seed, options=options)
+            invalid += bool(jtd.validate(schema=schema, instance=instance))
+        self.assertGreater(invalid, 0)
+
+    def test_ndjson(self):
+        schema = jtd.Schema.from_dict(SCHEMA)
+        out = io.StringIO()
+        jtd.generate_ndjson(schema=schema, file=out, count=20, seed=7)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(20, len(lines))
+        for line in lines:
+            self.assertEqual([], jtd.validate(schema=schema, instance=json.loads(line)))
@@ -0,0 +1,82 @@
+import unittest
+import jtd
+
+VERSIONS = [
+    {
+        'properties': {
+            'id': { 'type': 'string' },
+            'at': { 'type': 'timestamp' },
+        },
+    },
+    {
+        'properties': {
+            'id': { 'type': 'string' },
+            'at': { 'type': 'timestamp' },
+        },
+        'optionalProperties': {
+            'tags': { 'elements': { 'enum': ['a', 'b'] }},
+        },
+    },
+    {
+        'definitions': {
+            'node': { 'values': { 'ref': 'node' }, 'nullable': True },
+        },
+        'properties': {
+            'id': { 'type': 'uint32' },
+            'at': { 'type': 'timestamp', 'nullable': True },
+            'tree': { 'ref': 'node' },
+        },
+        'additionalProperties': True,
+    },
+    {
+        'discriminator': 'kind',
+        'mapping': {
+            'a': { 'properties': { 'id': { 'type': 'string' }}},
+            'b': { 'properties': { 'id': { 'type': 'int8' }}},
+        },
+    },
+    {
+        'definitions': { 'loop': { 'ref': 'loop' }},
+        'ref': 'loop',
+    },
+    {},
+]
+
+class TestMatch(unittest.TestCase):
+    def test_matches_validate(self):
+        schemas = [jtd.Schema.from_dict(v) for v in VERSIONS]
+        optimized = [r.schema for r in jtd.optimize_all(schemas)]
+
+        options = jtd.GenerationOptions(mutation_rate=0.1)
+        for seed in range(100):
+            source = schemas[seed % 4]
+            instance = jtd.generate(schema=source, seed=seed, options=options)
+
+            with self.subTest(seed):
+                expected = [
+                    i for i, s in enumerate(schemas[:4])
+                    if not jtd.validate(schema=s, instance=instance)
+                ] + [5]
+
+                matches = jtd.match_all(schemas=schemas, instance=instance)
+                self.assertEqual(expected, [schemas.index(s) for s in matches])
+
+                matches = jtd.match_all(schemas=optimized, instance=instance)
+                self.assertEqual(expected, [optimized.index(s) for s in matches])
+
+    def test_match_any(self):
+        schemas = [jtd.Schema.from_dict(v) for v in VERSIONS[:4]]
+        self.assertIs(schemas[1], jtd.match_any(schemas=schemas, instance={
+            'id': 'x',
+            'at': '2020-01-01T00:00:00Z',
+            'tags': ['a'],
+        }))
+
+        self.assertIsNone(jtd.match_any(schemas=schemas, instance=[]))
+
+    def test_container_protocols(self):
+        schemas = [jtd.Schema.from_dict({ 'elements': { 'type': 'string' }})]
+        self.assertEqual([], jtd.match_all(schemas=schemas, instance=('a',)))
+
+        options = jtd.ValidationOptions(container_protocols=True)
+        self.assertEqual(schemas, jtd.match_all(schemas=schemas, instance=('a',), options=options))
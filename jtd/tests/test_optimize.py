@@ -0,0 +1,55 @@
+import unittest
+import jtd
+
+class TestOptimize(unittest.TestCase):
+    def test_interning(self):
+        timestamp = { 'type': 'timestamp', 'nullable': True }
+        schema = jtd.Schema.from_dict({
+            'properties': { str(i): { 'properties': { 'at': timestamp }} for i in range(100) },
+        })
+
+        result = jtd.optimize(schema)
+        self.assertEqual(201, result.nodes_before)
+        self.assertEqual(3, result.nodes_after)
+        result.schema.validate()
+
+        instance = { str(i): { 'at': 'x' if i % 10 == 0 else None } for i in range(100) }
+        self.assertEqual(
+            jtd.validate(schema=schema, instance=instance),
+            jtd.validate(schema=result.schema, instance=instance),
+        )
+
+    def test_ref_inlining(self):
+        schema = jtd.Schema.from_dict({
+            'definitions': {
+                'once': { 'properties': { 'a': { 'ref': 'leaf' }}},
+                'twice': { 'elements': { 'type': 'string' }},
+                'leaf': { 'enum': ['x', 'y'] },
+                'tree': { 'values': { 'ref': 'tree' }},
+            },
+            'properties': {
+                'a': { 'ref': 'once', 'nullable': True },
+                'b': { 'ref': 'twice' },
+                'c': { 'ref': 'twice' },
+                'd': { 'ref': 'tree' },
+                'e': { 'ref': 'leaf', 'metadata': { 'description': 'kept' }},
+            },
+        })
+
+        optimized = jtd.optimize(schema).schema
+        optimized.validate()
+
+        self.assertEqual(['twice', 'leaf', 'tree'], list(optimized.definitions))
+        self.assertEqual(['x', 'y'], optimized.properties['a'].properties['a'].enum)
+        self.assertTrue(optimized.properties['a'].nullable)
+        self.assertEqual('leaf', optimized.properties['e'].ref)
+        self.assertIsNone(schema.properties['a'].properties)
+
+        instance = { 'a': { 'a': 'z' }, 'b': [1], 'c': [], 'd': { 'x': { 'y': 1 }}, 'e': 'x' }
+        self.assertEqual([
+            jtd.ValidationError(instance_path=['a', 'a'], schema_path=['properties', 'a', 'properties', 'a', 'enum']),
+            jtd.ValidationError(instance_path=['b', '0'], schema_path=['definitions', 'twice', 'elements', 'type']),
+            jtd.ValidationError(instance_path=['d', 'x', 'y'], schema_path=['definitions', 'tree', 'values']),
+        ], jtd.validate(schema=optimized, instance=instance))
+
+        self.assertIsNone(jtd.optimize(schema).schema.properties['a'].properties['a'].nullable)
@@ -0,0 +1,156 @@
+import unittest
+import jtd
+
+SCHEMA = {
+    'definitions': {
+        'item': {
+            'properties': {
+                'id': { 'type': 'uint32' },
+                'children': { 'elements': { 'ref': 'item' }},
+            },
+        },
+    },
+    'properties': {
+        'name': { 'type': 'string' },
+        'items': { 'elements': { 'ref': 'item' }},
+        'labels': { 'values': { 'type': 'string' }},
+        'event': {
+            'discriminator': 'kind',
+            'mapping': {
+                'a': { 'properties': { 'x': { 'type': 'string' }}},
+                'b': { 'properties': { 'y': { 'type': 'int8' }}},
+            },
+        },
+    },
+    'optionalProperties': {
+        'note': { 'type': 'string', 'nullable': True },
+    },
+}
+
+def valid_instance():
+    return {
+        'name': 'root',
+        'items': [
+            { 'id': 1, 'children': [] },
+            { 'id': 2, 'children': [{ 'id': 3, 'children': [] }] },
+        ],
+        'labels': { 'p': 'q', 'r': 's' },
+        'event': { 'kind': 'a', 'x': 'foo' },
+    }
+
+class TestRevalidate(unittest.TestCase):
+    def assert_matches_validate(self, instance, patch):
+        schema = jtd.Schema.from_dict(SCHEMA)
+        expected = jtd.validate(schema=schema, instance=instance)
+        actual = jtd.revalidate(schema=schema, instance=instance, patch=patch)
+        self.assertEqual(expected, actual)
+        return actual
+
+    def test_unchanged(self):
+        self.assertEqual([], self.assert_matches_validate(valid_instance(), []))
+
+    def test_replace_leaf(self):
+        instance = valid_instance()
+        instance['items'][1]['children'][0]['id'] = -1
+        patch = [{ 'op': 'replace', 'path': '/items/1/children/0/id', 'value': -1 }]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_remove_required(self):
+        instance = valid_instance()
+        del instance['name']
+        patch = [{ 'op': 'remove', 'path': '/name' }]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_additional_properties(self):
+        instance = valid_instance()
+        instance['items'][0]['z'] = 1
+        instance['a~b/c'] = 2
+        patch = [
+            { 'op': 'add', 'path': '/items/0/z', 'value': 1 },
+            { 'op': 'add', 'path': '/a~0b~1c', 'value': 2 },
+        ]
+        self.assertEqual(2, len(self.assert_matches_validate(instance, patch)))
+
+    def test_append(self):
+        instance = valid_instance()
+        instance['items'].append({ 'id': 'x' })
+        instance['items'].append({ 'id': 4, 'children': [] })
+        patch = [
+            { 'op': 'add', 'path': '/items/-', 'value': { 'id': 'x' }},
+            { 'op': 'add', 'path': '/items/-', 'value': { 'id': 4, 'children': [] }},
+        ]
+        self.assertEqual(2, len(self.assert_matches_validate(instance, patch)))
+
+    def test_append_and_remove(self):
+        instance = valid_instance()
+        instance['items'].append(None)
+        del instance['items'][0]
+        patch = [
+            { 'op': 'add', 'path': '/items/-', 'value': None },
+            { 'op': 'remove', 'path': '/items/0' },
+        ]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_insert_then_insert(self):
+        instance = valid_instance()
+        instance['items'].insert(0, None)
+        instance['items'].insert(0, { 'id': 0, 'children': [] })
+        patch = [
+            { 'op': 'add', 'path': '/items/0', 'value': None },
+            { 'op': 'add', 'path': '/items/0', 'value': { 'id': 0, 'children': [] }},
+        ]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_replace_then_remove(self):
+        instance = valid_instance()
+        instance['items'].append({ 'id': 3, 'children': [] })
+        instance['items'].append({ 'id': 4, 'children': [] })
+        instance['items'][3] = None
+        del instance['items'][0]
+        patch = [
+            { 'op': 'replace', 'path': '/items/3', 'value': None },
+            { 'op': 'remove', 'path': '/items/0' },
+        ]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_remove_then_replace_nested(self):
+        instance = valid_instance()
+        del instance['items'][0]
+        instance['items'][0]['children'][0]['id'] = None
+        patch = [
+            { 'op': 'remove', 'path': '/items/0' },
+            { 'op': 'replace', 'path': '/items/0/children/0/id', 'value': None },
+        ]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_values(self):
+        instance = valid_instance()
+        instance['labels']['r'] = 1
+        instance['labels']['p'] = 2
+        patch = [
+            { 'op': 'replace', 'path': '/labels/r', 'value': 1 },
+            { 'op': 'replace', 'path': '/labels/p', 'value': 2 },
+        ]
+        self.assertEqual(2, len(self.assert_matches_validate(instance, patch)))
+
+    def test_discriminator_tag(self):
+        instance = valid_instance()
+        instance['event']['kind'] = 'b'
+        patch = [{ 'op': 'replace', 'path': '/event/kind', 'value': 'b' }]
+        self.assertEqual(2, len(self.assert_matches_validate(instance, patch)))
+
+    def test_discriminator_mapping(self):
+        instance = valid_instance()
+        instance['event']['x'] = None
+        patch = [{ 'op': 'replace', 'path': '/event/x', 'value': None }]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_move(self):
+        instance = valid_instance()
+        instance['note'] = instance.pop('name')
+        patch = [{ 'op': 'move', 'from': '/name', 'path': '/note' }]
+        self.assertEqual(1, len(self.assert_matches_validate(instance, patch)))
+
+    def test_replace_root(self):
+        patch = [{ 'op': 'replace', 'path': '', 'value': [] }]
+        self.assertEqual(1, len(self.assert_matches_validate([], patch)))
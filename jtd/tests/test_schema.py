@@ -13,3 +13,49 @@ class TestSchema(unittest.TestCase):
                         schema.validate()
 
                     self.assertIsInstance(c.exception, (AttributeError, TypeError))
+
+    def test_check(self):
+        schema = jtd.Schema.from_dict({
+            'definitions': {
+                'a': { 'type': 'string', 'elements': {} },
+            },
+            'properties': {
+                'b': { 'ref': 'c' },
+                'd': { 'enum': ['x', 'x'], 'nullable': 'yes' },
+                'e': {
+                    'discriminator': 'f',
+                    'mapping': { 'g': { 'properties': { 'f': {} }}},
+                },
+            },
+            'additionalProperties': True,
+        })
+
+        self.assertEqual([
+            jtd.SchemaError(path=['definitions', 'a'], message='invalid form'),
+            jtd.SchemaError(path=['properties', 'b', 'ref'], message='ref to non-existent definition'),
+            jtd.SchemaError(path=['properties', 'd', 'nullable'], message='nullable not bool'),
+            jtd.SchemaError(path=['properties', 'd', 'enum'], message='enum contains duplicates'),
+            jtd.SchemaError(path=['properties', 'e', 'mapping', 'g'], message='mapping properties redefines discriminator'),
+        ], schema.check())
+
+        with self.assertRaises(TypeError):
+            schema.validate()
+
+    def test_check_valid(self):
+        schema = jtd.Schema.from_dict({
+            'definitions': { 'a': { 'values': { 'ref': 'a' }}},
+            'optionalProperties': { 'b': { 'ref': 'a', 'nullable': True }},
+            'additionalProperties': True,
+        })
+
+        self.assertEqual([], schema.check())
+        schema.validate()
+
+    def test_check_deep(self):
+        schema = jtd.Schema.from_dict({})
+        for _ in range(10000):
+            parent = jtd.Schema.from_dict({})
+            parent.values = schema
+            schema = parent
+
+        self.assertEqual([], schema.check())
@@ -1,6 +1,9 @@
 import unittest
 import jtd
+import collections.abc
 import json
+import time
+import types
 
 # We skip these tests because strict_rfc3339 does not tolerate leap seconds.
 SKIPPED_TESTS = [
@@ -43,3 +46,188 @@ class TestSchema(unittest.TestCase):
                     schema = jtd.Schema.from_dict(v["schema"])
                     actual = jtd.validate(schema=schema, instance=v["instance"])
                     self.assertEqual(expected, actual)
+
+    def test_sampling(self):
+        schema = jtd.Schema.from_dict({
+            'properties': {
+                'items': { 'elements': { 'type': 'uint8' }},
+                'labels': { 'values': { 'type': 'string' }},
+            },
+        })
+
+        instance = {
+            'items': [1] * 999 + ['x'],
+            'labels': { str(i): 'x' for i in range(10) },
+        }
+
+        options = jtd.ValidationOptions(sample_size=100, sample_rate=0.5, sample_seed=1)
+        result = jtd.validate_sampled(schema=schema, instance=instance, options=options)
+
+        self.assertEqual([
+            jtd.SkippedEntries(instance_path=['items'], schema_path=['properties', 'items', 'elements'], skipped=900),
+            jtd.SkippedEntries(instance_path=['labels'], schema_path=['properties', 'labels', 'values'], skipped=5),
+        ], result.skipped)
+
+        again = jtd.validate_sampled(schema=schema, instance=instance, options=options)
+        self.assertEqual(result, again)
+
+        self.assertEqual([], jtd.validate_sampled(schema=schema, instance={}, options=options).skipped)
+        self.assertEqual(2, len(jtd.validate_sampled(schema=schema, instance={}, options=options).errors))
+
+        for options in [
+            jtd.ValidationOptions(sample_rate=-0.5),
+            jtd.ValidationOptions(sample_rate=1.5),
+            jtd.ValidationOptions(sample_size=-1),
+        ]:
+            with self.assertRaises(ValueError):
+                jtd.validate(schema=schema, instance=instance, options=options)
+
+        options = jtd.ValidationOptions(sample_size=1)
+        errors = jtd.validate(schema=schema, instance={ 'items': [None] * 5, 'labels': {} }, options=options)
+        self.assertEqual(1, len(errors))
+
+    def test_max_nodes(self):
+        schema = jtd.Schema.from_dict({ 'values': { 'elements': { 'type': 'string' }}})
+        instance = { 'a': ['x'] * 10, 'b': ['x'] * 10 }
+
+        options = jtd.ValidationOptions(max_nodes=23)
+        self.assertEqual([], jtd.validate(schema=schema, instance=instance, options=options))
+
+        with self.assertRaises(jtd.BudgetExceededError) as c:
+            options = jtd.ValidationOptions(max_nodes=20)
+            jtd.validate(schema=schema, instance=instance, options=options)
+
+        self.assertEqual(21, c.exception.nodes_visited)
+        self.assertEqual(['b', '7'], c.exception.instance_path)
+
+    def test_deadline(self):
+        schema = jtd.Schema.from_dict({ 'elements': {} })
+
+        options = jtd.ValidationOptions(deadline=time.monotonic() + 3600)
+        self.assertEqual([], jtd.validate(schema=schema, instance=[None] * 5000, options=options))
+
+        with self.assertRaises(jtd.BudgetExceededError) as c:
+            options = jtd.ValidationOptions(deadline=time.monotonic())
+            jtd.validate(schema=schema, instance=[None] * 5000, options=options)
+
+        self.assertEqual(1024, c.exception.nodes_visited)
+
+    def test_container_protocols(self):
+        class LazyMapping(collections.abc.Mapping):
+            def __init__(self, data):
+                self.data = data
+
+            def __getitem__(self, key):
+                return self.data[key]
+
+            def __iter__(self):
+                return iter(self.data)
+
+            def __len__(self):
+                return len(self.data)
+
+        class Ordered(collections.OrderedDict):
+            pass
+
+        schema = jtd.Schema.from_dict({
+            'properties': {
+                'items': { 'elements': { 'type': 'string' }},
+                'labels': { 'values': { 'type': 'uint8' }},
+                'event': {
+                    'discriminator': 'kind',
+                    'mapping': { 'a': { 'properties': { 'x': { 'type': 'string' }}}},
+                },
+            },
+        })
+
+        instance = types.MappingProxyType({
+            'items': ('a', 'b', 3),
+            'labels': Ordered(x=1, y=-1),
+            'event': LazyMapping({ 'kind': 'a', 'x': 'y' }),
+        })
+
+        self.assertEqual(
+            [jtd.ValidationError(instance_path=[], schema_path=['properties'])],
+            jtd.validate(schema=schema, instance=instance),
+        )
+
+        options = jtd.ValidationOptions(container_protocols=True)
+        self.assertEqual([
+            jtd.ValidationError(instance_path=['items', '2'], schema_path=['properties', 'items', 'elements', 'type']),
+            jtd.ValidationError(instance_path=['labels', 'y'], schema_path=['properties', 'labels', 'values', 'type']),
+        ], jtd.validate(schema=schema, instance=instance, options=options))
+
+        schema = jtd.Schema.from_dict({ 'elements': {} })
+        self.assertEqual(1, len(jtd.validate(schema=schema, instance="abc", options=options)))
+
+    def test_validate_at(self):
+        schema = jtd.Schema.from_dict({
+            'definitions': {
+                'node': {
+                    'properties': {
+                        'id': { 'type': 'uint8' },
+                        'children': { 'elements': { 'ref': 'node' }},
+                    },
+                },
+            },
+            'properties': {
+                'root': { 'ref': 'node' },
+                'labels': { 'values': { 'enum': ['a', 'b'] }},
+                'extra': {},
+                'event': {
+                    'discriminator': 'kind',
+                    'mapping': {
+                        'a': { 'properties': { 'x': { 'type': 'string' }}},
+                        'b': { 'optionalProperties': { 'y': { 'type': 'string' }}},
+                    },
+                },
+            },
+        })
+
+        def pointers(instance, tokens):
+            yield tokens
+            if type(instance) is list:
+                for i, v in enumerate(instance):
+                    yield from pointers(v, tokens + [str(i)])
+            elif type(instance) is dict:
+                for k, v in instance.items():
+                    yield from pointers(v, tokens + [k])
+
+        options = jtd.GenerationOptions(mutation_rate=0.1)
+        for seed in range(20):
+            instance = jtd.generate(schema=schema, seed=seed, options=options)
+            errors = jtd.validate(schema=schema, instance=instance)
+
+            for tokens in pointers(instance, []):
+                pointer = "".join("/" + t.replace("~", "~0").replace("/", "~1") for t in tokens)
+
+                with self.subTest(seed=seed, pointer=pointer):
+                    try:
+                        actual = jtd.validate_at(schema=schema, instance=instance, pointer=pointer)
+                    except jtd.PointerResolutionError:
+                        continue
+
+                    expected = [e for e in errors if e.instance_path[:len(tokens)] == tokens]
+                    self.assertEqual(expected, actual)
+
+    def test_validate_at_unresolvable(self):
+        schema = jtd.Schema.from_dict({
+            'properties': {
+                'a': { 'elements': { 'type': 'string' }},
+                'b': {
+                    'discriminator': 'kind',
+                    'mapping': { 'x': { 'properties': { 'c': {} }}},
+                },
+            },
+        })
+
+        instance = { 'a': ['x'], 'b': { 'kind': 'y', 'c': 1 }}
+        for pointer in ['/a/1', '/a/01', '/a/0/0', '/b/c', '/z']:
+            with self.subTest(pointer):
+                with self.assertRaises(jtd.PointerResolutionError):
+                    jtd.validate_at(schema=schema, instance=instance, pointer=pointer)
+
+        self.assertEqual(
+            [jtd.ValidationError(instance_path=['b', 'kind'], schema_path=['properties', 'b', 'mapping'])],
+            jtd.validate_at(schema=schema, instance=instance, pointer='/b/kind'),
+        )
@@ -1,5 +1,9 @@
+import collections.abc
 import dataclasses
+import math
+import random
 import strict_rfc3339
+import time
 from typing import Any, List, Optional
 
 from .schema import Form, Schema
@@ -35,6 +39,92 @@ class ValidationOptions:
     A value of zero means that all errors will be returned.
     """
 
+    max_nodes: int = 0
+    """
+    The maximum number of nodes that will be visited before raising
+    :class:`BudgetExceededError`. A node is visited each time a value in the
+    instance is checked against a schema, or a ref is followed.
+
+    A value of zero means that there is no limit.
+    """
+
+    deadline: float = 0
+    """
+    A point in time, as returned by :func:`time.monotonic`, after which
+    validation gives up and raises :class:`BudgetExceededError`. To keep
+    overhead low, the clock is only read once every thousand or so nodes, so
+    validation may run slightly past the deadline.
+
+    A value of zero means that there is no deadline.
+    """
+
+    container_protocols: bool = False
+    """
+    Whether to accept any :class:`collections.abc.Sequence` (other than strings
+    and bytes) where an array is expected, and any
+    :class:`collections.abc.Mapping` where an object is expected.
+
+    By default, only ``list`` and ``dict`` are accepted, as produced by
+    ``json.loads``. Turning this on lets you validate tuples,
+    ``types.MappingProxyType``, or lazy mapping wrappers directly, without
+    copying them into lists and dicts first.
+    """
+
+    sample_size: int = 0
+    """
+    The maximum number of entries of each array (``elements``) or object
+    (``values``) that will be checked. Entries to check are picked at random,
+    using ``sample_seed``.
+
+    A value of zero means that all entries will be checked. ``properties`` and
+    ``discriminator`` are always checked in full. Negative values raise a
+    ``ValueError`` before validation starts.
+    """
+
+    sample_rate: float = 0
+    """
+    The fraction, between zero and one, of entries of each array
+    (``elements``) or object (``values``) that will be checked. Entries to check
+    are picked at random, using ``sample_seed``.
+
+    A value of zero means that all entries will be checked. If ``sample_size``
+    is also set, whichever picks fewer entries wins. Values outside of zero to
+    one raise a ``ValueError`` before validation starts.
+    """
+
+    sample_seed: int = 0
+    """
+    The seed used to pick entries when ``sample_size`` or ``sample_rate`` are
+    set. Validating the same instance with the same seed checks the same
+    entries.
+    """
+
+@dataclasses.dataclass
+class SkippedEntries:
+    """
+    Represents an array or object whose entries were only partially checked,
+    because of ``sample_size`` or ``sample_rate`` in :class:`ValidationOptions`.
+    """
+
+    instance_path: List[str]
+    """Path to the array or object that was partially checked."""
+
+    schema_path: List[str]
+    """Path to the ``elements`` or ``values`` that describes its entries."""
+
+    skipped: int
+    """Number of entries that were not checked."""
+
+@dataclasses.dataclass
+class SamplingResult:
+    """Represents the outcome of :func:`validate_sampled`."""
+
+    errors: List[ValidationError]
+    """Validation errors found among the entries that were checked."""
+
+    skipped: List[SkippedEntries]
+    """Arrays and objects that had entries skipped."""
+
 class MaxDepthExceededError(Exception):
     """
     Indicates that ref recursion depth exceeded the limit put in place by
@@ -43,6 +133,29 @@ class MaxDepthExceededError(Exception):
 
     pass
 
+class PointerResolutionError(Exception):
+    """
+    Indicates that the pointer passed to :func:`validate_at` does not point to
+    a value in the instance, or to a part of the instance the schema describes.
+    """
+
+    pass
+
+class BudgetExceededError(Exception):
+    """
+    Indicates that validation visited more nodes than ``max_nodes``, or ran past
+    ``deadline``, in :class:`ValidationOptions`.
+    """
+
+    def __init__(self, nodes_visited: int, instance_path: List[str]):
+        super().__init__("validation budget exceeded after {} nodes at {}".format(nodes_visited, instance_path))
+
+        self.nodes_visited = nodes_visited
+        """Number of nodes visited before giving up."""
+
+        self.instance_path = instance_path
+        """Path to the part of the instance being validated when giving up."""
+
 def validate(**kwargs) -> List[ValidationError]:
     """
     Performs JSON Typedef validation, and returns a list of validation errors.
@@ -74,6 +187,51 @@ def validate(**kwargs) -> List[ValidationError]:
     Traceback (most recent call last):
         ...
     MaxDepthExceededError
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({ 'elements': { 'type': 'string' }})
+    >>> options = jtd.ValidationOptions(max_nodes=100)
+    >>> jtd.validate(schema=schema, instance=['a'] * 1000, options=options)
+    Traceback (most recent call last):
+        ...
+    BudgetExceededError: validation budget exceeded after 101 nodes at ['99']
+    """
+
+    return _run_validation(kwargs).errors
+
+def validate_at(**kwargs) -> List[ValidationError]:
+    """
+    Performs JSON Typedef validation of just one part of an instance, and
+    returns a list of validation errors.
+
+    Provide the schema using the `schema` keyword argument, the whole instance
+    with the `instance` keyword argument, and a JSON Pointer (RFC 6901) to the
+    part to validate with the `pointer` keyword argument. Optionally, you can
+    pass :class:`ValidationOptions` with the `options` keyword argument.
+
+    The pointer is followed through the instance and the schema together, and
+    only the value it points to is validated. The errors returned are the ones
+    :func:`validate` would return for that value, with the same full
+    ``instance_path`` and ``schema_path``. If the pointer goes through a
+    property the schema does not allow, the error for that property is returned
+    instead.
+
+    Raises :class:`PointerResolutionError` if there is no value at the pointer,
+    or if the schema does not say what that value should be, for instance
+    because a discriminator tag along the way is invalid.
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({
+    ...     'properties': {
+    ...         'name': { 'type': 'string' },
+    ...         'payload': {
+    ...             'properties': { 'items': { 'elements': { 'type': 'uint8' }}},
+    ...         },
+    ...     },
+    ... })
+    >>> instance = { 'name': None, 'payload': { 'items': [1, 2, 'x'] }}
+    >>> jtd.validate_at(schema=schema, instance=instance, pointer='/payload/items')
+    [ValidationError(instance_path=['payload', 'items', '2'], schema_path=['properties', 'payload', 'properties', 'items', 'elements', 'type'])]
     """
 
     state = _ValidationState(
@@ -84,13 +242,139 @@ def validate(**kwargs) -> List[ValidationError]:
         errors=[],
     )
 
+    schema = kwargs['schema']
+    instance = kwargs['instance']
+    parent_tag = None
+
+    tokens = _parse_pointer(kwargs['pointer'])
+    i = 0
+    refs_followed = set()
+
     try:
-        _validate_with_state(state, kwargs['schema'], kwargs['instance'], None)
+        while i < len(tokens):
+            token = tokens[i]
+
+            form = schema.form()
+            if form == Form.REF:
+                if len(state.schema_tokens) == state.config.max_depth:
+                    raise MaxDepthExceededError()
+
+                if schema.ref in refs_followed:
+                    raise PointerResolutionError("ref cycle at {}".format(state.instance_tokens))
+
+                refs_followed.add(schema.ref)
+                state.schema_tokens.append(["definitions", schema.ref])
+                schema = state.root_schema.definitions[schema.ref]
+                parent_tag = None
+                continue
+
+            if form == Form.DISCRIMINATOR and (type(instance) is dict or _is_mapping(state.config, instance)):
+                if token == schema.discriminator:
+                    # The tag itself is checked by the discriminator, which
+                    # reports errors at the tag's instance path.
+                    tag = _resolve_token(state, instance, token)
+                    _resolve_tokens(state, tag, tokens[i + 1:])
+
+                    state.push_instance_token(token)
+                    if type(tag) is not str:
+                        state.push_schema_token("discriminator")
+                        state.push_error()
+                    elif tag not in schema.mapping:
+                        state.push_schema_token("mapping")
+                        state.push_error()
+                    return state.errors
+
+                tag = instance.get(schema.discriminator)
+                if type(tag) is not str or tag not in schema.mapping:
+                    raise PointerResolutionError("invalid discriminator tag at {}".format(state.instance_tokens))
+
+                state.push_schema_token("mapping")
+                state.push_schema_token(tag)
+                parent_tag = schema.discriminator
+                schema = schema.mapping[tag]
+                continue
+
+            value = _resolve_token(state, instance, token)
+
+            if form == Form.ELEMENTS and (type(instance) is list or _is_sequence(state.config, instance)):
+                state.push_schema_token("elements")
+                schema = schema.elements
+            elif form == Form.PROPERTIES and (type(instance) is dict or _is_mapping(state.config, instance)):
+                if token in (schema.properties or {}):
+                    state.push_schema_token("properties")
+                    state.push_schema_token(token)
+                    schema = schema.properties[token]
+                elif token in (schema.optional_properties or {}):
+                    state.push_schema_token("optionalProperties")
+                    state.push_schema_token(token)
+                    schema = schema.optional_properties[token]
+                else:
+                    _resolve_tokens(state, value, tokens[i + 1:])
+
+                    if not schema.additional_properties and token != parent_tag:
+                        state.push_instance_token(token)
+                        state.push_error()
+                    return state.errors
+            elif form == Form.VALUES and (type(instance) is dict or _is_mapping(state.config, instance)):
+                state.push_schema_token("values")
+                schema = schema.values
+            elif form == Form.EMPTY:
+                _resolve_tokens(state, value, tokens[i + 1:])
+                return state.errors
+            else:
+                raise PointerResolutionError("schema does not describe {}".format(state.instance_tokens + [token]))
+
+            state.push_instance_token(token)
+            instance = value
+            parent_tag = None
+            refs_followed.clear()
+            i += 1
+
+        _validate_with_state(state, schema, instance, parent_tag)
     except _MaxErrorsReached:
         pass
 
     return state.errors
 
+def validate_sampled(**kwargs) -> SamplingResult:
+    """
+    Performs JSON Typedef validation like :func:`validate`, but also reports
+    which arrays and objects were only partially checked because of
+    ``sample_size`` or ``sample_rate`` in :class:`ValidationOptions`.
+
+    This is meant for cheaply spotting drift in very large instances. Entries
+    that were skipped may still be invalid, so a full validation can be
+    scheduled later for the paths in ``skipped``.
+
+    >>> import jtd
+    >>> schema = jtd.Schema.from_dict({ 'elements': { 'type': 'string' }})
+    >>> options = jtd.ValidationOptions(sample_size=10)
+    >>> result = jtd.validate_sampled(schema=schema, instance=['a'] * 1000, options=options)
+    >>> result.errors
+    []
+    >>> result.skipped
+    [SkippedEntries(instance_path=[], schema_path=['elements'], skipped=990)]
+    """
+
+    state = _run_validation(kwargs)
+    return SamplingResult(errors=state.errors, skipped=state.skipped)
+
+def _run_validation(kwargs) -> '_ValidationState':
+    state = _ValidationState(
+        config=kwargs.get('options', ValidationOptions()),
+        root_schema=kwargs['schema'],
+        instance_tokens=[],
+        schema_tokens=[[]],
+        errors=[],
+    )
+
+    try:
+        _validate_with_state(state, kwargs['schema'], kwargs['instance'], None)
+    except _MaxErrorsReached:
+        pass
+
+    return state
+
 @dataclasses.dataclass
 class _ValidationState:
     config: ValidationOptions
@@ -98,6 +382,19 @@ class _ValidationState:
     instance_tokens: List[str]
     schema_tokens: List[List[str]]
     errors: List[ValidationError]
+    skipped: List[SkippedEntries] = dataclasses.field(default_factory=list)
+    rng: Optional[random.Random] = None
+    nodes_visited: int = 0
+    budget_checkpoint: int = dataclasses.field(init=False, default=0)
+
+    def __post_init__(self):
+        if not 0 <= self.config.sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        if self.config.sample_size < 0:
+            raise ValueError("sample_size must not be negative")
+
+        self.budget_checkpoint = self.next_budget_checkpoint()
 
     def push_instance_token(self, token):
         self.instance_tokens.append(token)
@@ -120,10 +417,58 @@ class _ValidationState:
         if len(self.errors) == self.config.max_errors:
             raise _MaxErrorsReached()
 
+    def check_budget(self):
+        max_nodes_exceeded = self.config.max_nodes and self.nodes_visited > self.config.max_nodes
+        deadline_exceeded = self.config.deadline and time.monotonic() >= self.config.deadline
+
+        if max_nodes_exceeded or deadline_exceeded:
+            raise BudgetExceededError(self.nodes_visited, self.instance_tokens.copy())
+
+        self.budget_checkpoint = self.next_budget_checkpoint()
+
+    def next_budget_checkpoint(self) -> int:
+        # Budgets are only checked when nodes_visited reaches the checkpoint,
+        # so that the common case costs a single comparison per node. Zero is
+        # never reached, and so disables the check.
+        checkpoints = []
+        if self.config.max_nodes:
+            checkpoints.append(self.config.max_nodes + 1)
+        if self.config.deadline:
+            checkpoints.append(self.nodes_visited + _BUDGET_CHECK_INTERVAL)
+
+        return min(checkpoints, default=0)
+
+    def sample_indices(self, n: int):
+        count = n
+        if self.config.sample_rate:
+            count = min(count, math.ceil(n * self.config.sample_rate))
+        if self.config.sample_size:
+            count = min(count, self.config.sample_size)
+
+        if count == n:
+            return range(n)
+
+        if self.rng is None:
+            self.rng = random.Random(self.config.sample_seed)
+
+        self.skipped.append(SkippedEntries(
+            instance_path=self.instance_tokens.copy(),
+            schema_path=self.schema_tokens[-1].copy(),
+            skipped=n - count,
+        ))
+
+        return sorted(self.rng.sample(range(n), count))
+
 class _MaxErrorsReached(Exception):
     pass
 
+_BUDGET_CHECK_INTERVAL = 1024
+
 def _validate_with_state(state: _ValidationState, schema: Schema, instance: Any, parent_tag: Optional[str]):
+    state.nodes_visited += 1
+    if state.nodes_visited == state.budget_checkpoint:
+        state.check_budget()
+
     if schema.nullable and instance is None:
         return
 
@@ -170,16 +515,22 @@ def _validate_with_state(state: _ValidationState, schema: Schema, instance: Any,
         state.pop_schema_token()
     elif form == form.ELEMENTS:
         state.push_schema_token("elements")
-        if type(instance) is list:
-            for i, v in enumerate(instance):
-                state.push_instance_token(str(i))
-                _validate_with_state(state, schema.elements, v, None)
-                state.pop_instance_token()
+        if type(instance) is list or _is_sequence(state.config, instance):
+            if state.config.sample_size or state.config.sample_rate:
+                for i in state.sample_indices(len(instance)):
+                    state.push_instance_token(str(i))
+                    _validate_with_state(state, schema.elements, instance[i], None)
+                    state.pop_instance_token()
+            else:
+                for i, v in enumerate(instance):
+                    state.push_instance_token(str(i))
+                    _validate_with_state(state, schema.elements, v, None)
+                    state.pop_instance_token()
         else:
             state.push_error()
         state.pop_schema_token()
     elif form == form.PROPERTIES:
-        if type(instance) is dict:
+        if type(instance) is dict or _is_mapping(state.config, instance):
             state.push_schema_token("properties")
             for k, v in (schema.properties or {}).items():
                 state.push_schema_token(k)
@@ -221,16 +572,23 @@ def _validate_with_state(state: _ValidationState, schema: Schema, instance: Any,
             state.pop_schema_token()
     elif form == form.VALUES:
         state.push_schema_token("values")
-        if type(instance) is dict:
-            for k, v in instance.items():
-                state.push_instance_token(k)
-                _validate_with_state(state, schema.values, v, None)
-                state.pop_instance_token()
+        if type(instance) is dict or _is_mapping(state.config, instance):
+            if state.config.sample_size or state.config.sample_rate:
+                keys = list(instance)
+                for i in state.sample_indices(len(keys)):
+                    state.push_instance_token(keys[i])
+                    _validate_with_state(state, schema.values, instance[keys[i]], None)
+                    state.pop_instance_token()
+            else:
+                for k, v in instance.items():
+                    state.push_instance_token(k)
+                    _validate_with_state(state, schema.values, v, None)
+                    state.pop_instance_token()
         else:
             state.push_error()
         state.pop_schema_token()
     elif form == form.DISCRIMINATOR:
-        if type(instance) is dict:
+        if type(instance) is dict or _is_mapping(state.config, instance):
             if schema.discriminator in instance:
                 if type(instance[schema.discriminator]) is str:
                     if instance[schema.discriminator] in schema.mapping:
@@ -263,6 +621,40 @@ def _validate_with_state(state: _ValidationState, schema: Schema, instance: Any,
             state.push_error()
             state.pop_schema_token
 
+def _is_sequence(config: ValidationOptions, instance: Any) -> bool:
+    return config.container_protocols and isinstance(instance, collections.abc.Sequence) \
+        and not isinstance(instance, (str, bytes, bytearray))
+
+def _is_mapping(config: ValidationOptions, instance: Any) -> bool:
+    return config.container_protocols and isinstance(instance, collections.abc.Mapping)
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+
+    if not pointer.startswith("/"):
+        raise ValueError("JSON Pointer must be empty or start with '/'")
+
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+def _resolve_token(state: _ValidationState, instance: Any, token: str) -> Any:
+    if type(instance) is list or _is_sequence(state.config, instance):
+        if token.isdecimal() and str(int(token)) == token and int(token) < len(instance):
+            return instance[int(token)]
+    elif type(instance) is dict or _is_mapping(state.config, instance):
+        if token in instance:
+            return instance[token]
+
+    raise PointerResolutionError("no value at {}".format(state.instance_tokens + [token]))
+
+def _resolve_tokens(state: _ValidationState, instance: Any, tokens: List[str]):
+    for token in tokens:
+        instance = _resolve_token(state, instance, token)
+        state.push_instance_token(token)
+
+    for _ in tokens:
+        state.pop_instance_token()
+
 def _validate_int(state: _ValidationState, min: int, max: int, instance: Any):
     if type(instance) not in [int, float]:
         state.push_error()